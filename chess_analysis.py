@@ -1,41 +1,122 @@
 #!/usr/bin/env python3
+import asyncio
 import subprocess
 import sys
-import time
-import threading
 import os
+import stat
+import threading
+from functools import lru_cache
 from datetime import datetime
 
+# Linux only: grow the engine's stdout pipe so bursts of info lines never block it
+PIPE_SIZE = 1 << 20
+F_SETPIPE_SZ = 1031
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds):
+    """Format a whole number of seconds as MM:SS."""
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+class _LineProtocol(asyncio.Protocol):
+    """Split raw pipe data into lines without a text-mode stream."""
+    
+    def __init__(self, lines):
+        self._lines = lines
+        self._buf = bytearray()
+    
+    def data_received(self, data):
+        # The transport reads the non-blocking fd with os.read(); only whole
+        # lines leave the accumulator, each decoded once
+        self._buf += data
+        start = 0
+        while True:
+            nl = self._buf.find(b"\n", start)
+            if nl == -1:
+                break
+            self._lines.put_nowait(self._decode(self._buf[start:nl]))
+            start = nl + 1
+        del self._buf[:start]
+    
+    def eof_received(self):
+        if self._buf.strip():
+            self._lines.put_nowait(self._decode(self._buf))
+        self._buf.clear()
+        self._lines.put_nowait(None)
+    
+    def connection_lost(self, exc):
+        # Wake any reader if the pipe closed without a clean EOF
+        if exc is not None:
+            self._lines.put_nowait(None)
+    
+    def _decode(self, line):
+        # Bad bytes, e.g. in an 'info string', must not take the reader down
+        return line.decode(errors="replace").strip()
+
+class _EngineProtocol(asyncio.SubprocessProtocol):
+    """Route the engine's stdout through a line protocol and note when it exits."""
+    
+    def __init__(self, lines, exited):
+        self._stdout = _LineProtocol(lines)
+        self._exited = exited
+    
+    def pipe_data_received(self, fd, data):
+        # stderr is read and dropped so the engine can never block on it
+        if fd == 1:
+            self._stdout.data_received(data)
+    
+    def pipe_connection_lost(self, fd, exc):
+        if fd == 1:
+            if exc is None:
+                self._stdout.eof_received()
+            else:
+                self._stdout.connection_lost(exc)
+    
+    def process_exited(self):
+        if not self._exited.done():
+            self._exited.set_result(None)
+
 class StockfishTerminal:
     def __init__(self, path_to_stockfish="stockfish"):
-        """Initialize the Stockfish engine process."""
+        """Set up the interface; call start() to launch the engine."""
+        self.path_to_stockfish = path_to_stockfish
+        self._transport = None
+        self._stdin = None
+        self._lines = None
+        self._exited = None
+        
+        # Initialize state variables
+        self.is_ready = False
+        self._pending_search = False
+        self.position = "startpos"
+        self.white_time = 600  # 10 minutes in seconds
+        self.black_time = 600
+        self.increment = 0
+        self.current_player = "white"
+        self.timer_running = False
+        self._timer_handle = None
+        self._last_tick = None
+    
+    async def start(self):
+        """Start the Stockfish engine process and complete the UCI handshake."""
         try:
             # Start Stockfish as a subprocess
-            self.process = subprocess.Popen(
-                path_to_stockfish,
-                universal_newlines=True,
+            loop = asyncio.get_running_loop()
+            self._lines = asyncio.Queue()
+            self._exited = loop.create_future()
+            self._transport, _ = await loop.subprocess_exec(
+                lambda: _EngineProtocol(self._lines, self._exited),
+                self.path_to_stockfish,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE
             )
+            self._stdin = self._transport.get_pipe_transport(0)
+            self._enlarge_pipe(self._transport.get_pipe_transport(1).get_extra_info("pipe"))
             
-            # Initialize state variables
-            self.is_ready = False
-            self.position = "startpos"
-            self.white_time = 600  # 10 minutes in seconds
-            self.black_time = 600
-            self.increment = 0
-            self.current_player = "white"
-            self.timer_running = False
-            self.timer_thread = None
-            
-            # Send UCI command to initialize the engine
-            self._send_command("uci")
-            self._wait_for_uciok()
-            
-            # Set up initial parameters
-            self._send_command("isready")
-            self._wait_for_readyok()
+            # Initialize the engine; it answers both commands in order
+            self._send_commands("uci", "isready")
+            await self._wait_for_uciok()
+            await self._wait_for_readyok()
             self.is_ready = True
             
             print("Stockfish engine initialized successfully.")
@@ -45,49 +126,70 @@ class StockfishTerminal:
     
     def _send_command(self, command):
         """Send a command to the Stockfish engine."""
+        self._send_commands(command)
+    
+    def _send_commands(self, *commands):
+        """Send several commands to the Stockfish engine in a single write."""
         try:
-            self.process.stdin.write(command + "\n")
-            self.process.stdin.flush()
+            self._stdin.write(("\n".join(commands) + "\n").encode())
         except Exception as e:
             print(f"Error sending command: {e}")
     
-    def _get_output(self, timeout=0.1):
+    def _enlarge_pipe(self, pipe):
+        """Raise a pipe's capacity so the engine is not stalled by slow reads."""
+        if not sys.platform.startswith("linux"):
+            return
+        
+        import fcntl
+        try:
+            fcntl.fcntl(pipe, F_SETPIPE_SZ, PIPE_SIZE)
+        except OSError:
+            # Above /proc/sys/fs/pipe-max-size; keep the default size
+            pass
+    
+    async def _read_line(self):
+        """Return the next engine output line."""
+        line = await self._lines.get()
+        if line is None:
+            # Leave the EOF marker for any later reader
+            self._lines.put_nowait(None)
+            raise EOFError("Stockfish closed its output")
+        return line
+    
+    async def _get_output(self, timeout=0.1):
         """Get output from the Stockfish engine."""
         output_lines = []
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
         
         while True:
-            # Check if there's any output available
-            if self.process.stdout.readable():
-                line = self.process.stdout.readline().strip()
-                if line:
-                    output_lines.append(line)
-                    # If we see bestmove, we're done
-                    if line.startswith("bestmove"):
-                        break
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
             
-            # Check if we've exceeded the timeout
-            if timeout and time.time() - start_time > timeout:
+            try:
+                line = await asyncio.wait_for(self._read_line(), remaining)
+            except asyncio.TimeoutError:
                 break
-            
-            # Small sleep to avoid tight loop
-            time.sleep(0.01)
+            if line:
+                output_lines.append(line)
+                # If we see bestmove, we're done
+                if line.startswith("bestmove"):
+                    break
         
         return output_lines
     
-    def _wait_for_uciok(self):
+    async def _wait_for_uciok(self):
         """Wait for the 'uciok' response from the engine."""
-        while True:
-            line = self.process.stdout.readline().strip()
-            if line == "uciok":
-                return
+        while await self._read_line() != "uciok":
+            pass
     
-    def _wait_for_readyok(self):
+    async def _wait_for_readyok(self):
         """Wait for the 'readyok' response from the engine."""
-        while True:
-            line = self.process.stdout.readline().strip()
-            if line == "readyok":
-                return
+        while await self._read_line() != "readyok":
+            pass
     
     def set_position(self, moves=None, fen=None):
         """Set the current position using moves or FEN notation."""
@@ -108,12 +210,8 @@ class StockfishTerminal:
         self._send_command(position_command)
         print(f"Position set: {position_command}")
     
-    def get_best_move(self, depth=15, movetime=None):
+    async def get_best_move(self, depth=15, movetime=None):
         """Get the best move for the current position."""
-        # Make sure the engine is ready
-        self._send_command("isready")
-        self._wait_for_readyok()
-        
         # Prepare go command
         go_command = "go"
         if depth:
@@ -121,84 +219,105 @@ class StockfishTerminal:
         if movetime:
             go_command += f" movetime {movetime}"
         
-        # Send the command
-        self._send_command(go_command)
+        # The engine is idle after every bestmove, so skip the isready round-trip;
+        # only a search that never finished has to be stopped, in the same write,
+        # and its result discarded
+        if self._pending_search:
+            self._send_commands("stop", go_command)
+            while not (await self._read_line()).startswith("bestmove"):
+                pass
+        else:
+            self._send_command(go_command)
+        self._pending_search = True
         
-        # Collect output until we get the best move
-        output = []
+        # Report analysis as it streams in until we get the best move
         best_move = None
         
         while True:
-            line = self.process.stdout.readline().strip()
-            output.append(line)
+            line = await self._read_line()
             
             if line.startswith("bestmove"):
                 best_move = line.split()[1]
+                self._pending_search = False
                 break
-        
-        # Print the analysis
-        for line in output:
+            
             if line.startswith("info") and "pv" in line:
-                parts = line.split()
-                try:
-                    depth_index = parts.index("depth")
-                    score_index = parts.index("score")
-                    pv_index = parts.index("pv")
-                    
-                    depth_value = parts[depth_index + 1]
-                    score_type = parts[score_index + 1]
-                    score_value = parts[score_index + 2]
-                    pv_moves = " ".join(parts[pv_index + 1:])
-                    
-                    print(f"Depth {depth_value} | Score {score_type} {score_value} | Line: {pv_moves}")
-                except (ValueError, IndexError):
-                    pass
+                self._print_info(line)
         
         return best_move
     
-    def _timer_loop(self):
-        """Timer loop to count down player time."""
-        last_time = time.time()
+    def _print_info(self, line):
+        """Print depth, score and principal variation from an info line."""
+        depth_value = score_type = score_value = pv_moves = None
+        it = iter(line.split())
+        try:
+            for tok in it:
+                if tok == "depth":
+                    depth_value = next(it)
+                elif tok == "score":
+                    score_type = next(it)
+                    score_value = next(it)
+                elif tok == "pv":
+                    pv_moves = " ".join(it)
+                    break
+        except StopIteration:
+            return
         
-        while self.timer_running:
-            current_time = time.time()
-            elapsed = current_time - last_time
-            last_time = current_time
-            
-            if self.current_player == "white":
-                self.white_time -= elapsed
-                if self.white_time <= 0:
-                    self.white_time = 0
-                    self.timer_running = False
-                    print("\nWhite's time has expired! Black wins on time.")
-            else:
-                self.black_time -= elapsed
-                if self.black_time <= 0:
-                    self.black_time = 0
-                    self.timer_running = False
-                    print("\nBlack's time has expired! White wins on time.")
-            
-            # Update time display every second
-            time.sleep(0.1)
+        if depth_value and score_type and pv_moves is not None:
+            print(f"Depth {depth_value} | Score {score_type} {score_value} | Line: {pv_moves}")
+    
+    def _update_clock(self):
+        """Charge the time since the last update to the player on move."""
+        if not self.timer_running:
+            return
+        
+        current_time = asyncio.get_running_loop().time()
+        elapsed = current_time - self._last_tick
+        self._last_tick = current_time
+        
+        if self.current_player == "white":
+            self.white_time -= elapsed
+            if self.white_time <= 0:
+                self.white_time = 0
+                self.timer_running = False
+                print("\nWhite's time has expired! Black wins on time.")
+        else:
+            self.black_time -= elapsed
+            if self.black_time <= 0:
+                self.black_time = 0
+                self.timer_running = False
+                print("\nBlack's time has expired! White wins on time.")
+    
+    def _timer_tick(self):
+        """Count down the clock every 100 ms from the event loop's own timeout."""
+        self._update_clock()
+        if self.timer_running:
+            self._timer_handle = asyncio.get_running_loop().call_later(0.1, self._timer_tick)
+        else:
+            self._timer_handle = None
     
     def start_timer(self):
         """Start the chess clock."""
         if not self.timer_running:
             self.timer_running = True
-            self.timer_thread = threading.Thread(target=self._timer_loop)
-            self.timer_thread.daemon = True
-            self.timer_thread.start()
+            loop = asyncio.get_running_loop()
+            self._last_tick = loop.time()
+            self._timer_handle = loop.call_later(0.1, self._timer_tick)
             print(f"Timer started. {self.current_player.capitalize()}'s move.")
     
     def stop_timer(self):
         """Stop the chess clock."""
+        self._update_clock()
         self.timer_running = False
-        if self.timer_thread:
-            self.timer_thread.join(timeout=1.0)
+        if self._timer_handle:
+            self._timer_handle.cancel()
+            self._timer_handle = None
         print("Timer stopped.")
     
     def switch_player(self):
         """Switch active player and apply increment."""
+        # Charge the partial tick to the player who just moved
+        self._update_clock()
         if self.current_player == "white":
             self.white_time += self.increment
             self.current_player = "black"
@@ -219,9 +338,8 @@ class StockfishTerminal:
     
     def _format_time(self, seconds):
         """Format time as MM:SS."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
+        # The display only changes once per second, so cache by whole seconds
+        return _format_whole_seconds(int(seconds))
     
     def _display_times(self):
         """Display current time for both players."""
@@ -229,11 +347,15 @@ class StockfishTerminal:
         black_formatted = self._format_time(self.black_time)
         print(f"White: {white_formatted} | Black: {black_formatted}")
     
-    def close(self):
+    async def close(self):
         """Close the Stockfish engine."""
-        if self.process:
+        if self._transport:
             self._send_command("quit")
-            self.process.terminate()
+            try:
+                await asyncio.wait_for(self._exited, timeout=1.0)
+            except asyncio.TimeoutError:
+                self._transport.terminate()
+            self._transport.close()
             print("Stockfish engine closed.")
 
 
@@ -255,22 +377,65 @@ def print_help():
     print("-" * 50)
 
 
-def main():
-    """Main function to run the terminal interface."""
-    # Get Stockfish path from command line or use default
-    stockfish_path = sys.argv[1] if len(sys.argv) > 1 else "stockfish"
+def _watch_stdin(loop):
+    """Queue lines typed on stdin from the event loop itself; None marks EOF."""
+    lines = asyncio.Queue()
+    protocol = _LineProtocol(lines)
+    fd = sys.stdin.fileno()
+    
+    def on_readable():
+        data = os.read(fd, 4096)
+        if data:
+            protocol.data_received(data)
+        else:
+            loop.remove_reader(fd)
+            protocol.eof_received()
+    
+    # epoll refuses regular files (input redirected from a file), and the
+    # proactor loop on Windows has no add_reader at all
+    if not stat.S_ISREG(os.fstat(fd).st_mode):
+        try:
+            loop.add_reader(fd, on_readable)
+            return lines
+        except NotImplementedError:
+            pass
+    
+    def read_lines():
+        try:
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(lines.put_nowait, line.strip())
+            loop.call_soon_threadsafe(lines.put_nowait, None)
+        except RuntimeError:
+            # The loop closed first; nobody is waiting for input any more
+            pass
+    
+    # A daemon thread, unlike the default executor, never holds up shutdown
+    threading.Thread(target=read_lines, daemon=True).start()
+    return lines
+
+
+async def run_terminal(stockfish_path):
+    """Run the command loop and engine I/O on a single event loop."""
+    loop = asyncio.get_running_loop()
     
     try:
         # Create Stockfish interface
         chess_engine = StockfishTerminal(stockfish_path)
+        await chess_engine.start()
         
         print("\nStockfish Terminal Interface")
         print("Type 'help' for available commands")
         
+        # Read commands on the loop so the clock keeps ticking and Ctrl-C still works
+        user_lines = _watch_stdin(loop)
+        
         # Main command loop
         while True:
             try:
-                user_input = input("\n> ").strip()
+                print("\n> ", end="", flush=True)
+                user_input = await user_lines.get()
+                if user_input is None:
+                    break
                 
                 if not user_input:
                     continue
@@ -319,12 +484,12 @@ def main():
                 
                 elif command == "best":
                     depth = int(cmd_parts[1]) if len(cmd_parts) > 1 else 15
-                    best_move = chess_engine.get_best_move(depth=depth)
+                    best_move = await chess_engine.get_best_move(depth=depth)
                     print(f"Best move: {best_move}")
                 
                 elif command == "go":
                     movetime = int(cmd_parts[1]) if len(cmd_parts) > 1 else None
-                    best_move = chess_engine.get_best_move(movetime=movetime)
+                    best_move = await chess_engine.get_best_move(movetime=movetime)
                     print(f"Best move: {best_move}")
                 
                 elif command == "start":
@@ -347,7 +512,7 @@ def main():
         
         # Clean up
         chess_engine.stop_timer()
-        chess_engine.close()
+        await chess_engine.close()
         print("Goodbye!")
     
     except Exception as e:
@@ -355,5 +520,12 @@ def main():
         sys.exit(1)
 
 
+def main():
+    """Main function to run the terminal interface."""
+    # Get Stockfish path from command line or use default
+    stockfish_path = sys.argv[1] if len(sys.argv) > 1 else "stockfish"
+    asyncio.run(run_terminal(stockfish_path))
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
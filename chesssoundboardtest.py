@@ -1,7 +1,6 @@
 import sounddevice as sd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import pygame
+import math
 import queue
 import time
 
@@ -10,6 +9,8 @@ DURATION_TO_HOLD = 3  # seconds
 MAX_SELECTION_TIME = 20  # max seconds per selection
 ROWS = ['8', '7', '6', '5', '4', '3', '2', '1']
 COLS = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+ROW_IX = {r: i for i, r in enumerate(ROWS)}
+COL_IX = {c: i for i, c in enumerate(COLS)}
 volume_queue = queue.Queue()
 
 # --- State Variables ---
@@ -26,153 +27,190 @@ pawn_target = None
 
 # --- Audio Callback ---
 def callback(indata, frames, time_info, status):
-    volume_norm = np.linalg.norm(indata) * 10
-    volume = min(volume_norm / 10.0, 1.0)
+    flat = indata.reshape(-1)
+    volume = min(math.sqrt(float(flat @ flat)), 1.0)
     volume_queue.put(volume)
 
 # --- Create GUI ---
-fig = plt.figure(figsize=(8, 9))
-gs = fig.add_gridspec(2, 2, width_ratios=[1, 8], height_ratios=[8, 1])
-ax_board = fig.add_subplot(gs[0, 1])
-ax_col_volume = fig.add_subplot(gs[0, 0])
-ax_row_volume = fig.add_subplot(gs[1, 1])
-
-# Column volume bar (vertical - now for column)
-col_bar = ax_col_volume.bar([0], [0], width=0.5, color='blue')[0]
-ax_col_volume.set_ylim(0, 1)
-ax_col_volume.set_xlim(-0.5, 0.5)
-ax_col_volume.set_xticks([])
-ax_col_volume.set_yticks([0, 0.5, 1])
-ax_col_volume.set_title("Column Volume")
-
-# Row volume bar (horizontal - now for row, growing left to right)
-row_bar = ax_row_volume.barh([0], [0], height=0.5, color='blue')[0]
-ax_row_volume.set_xlim(0, 1)
-ax_row_volume.set_ylim(-0.5, 0.5)
-ax_row_volume.set_xticks([0, 0.5, 1])
-ax_row_volume.set_yticks([])
-ax_row_volume.set_title("Row Volume")
-
-# Chessboard
-def draw_board(selected_square=None, highlight_coords=None, pawn_pos=None, pawn_target=None):
-    ax_board.clear()
-    colors = ['#F0D9B5', '#B58863']
-    for row in range(8):
-        for col in range(8):
-            color = colors[(row + col) % 2]
-            rect = patches.Rectangle((col, row), 1, 1, facecolor=color)
-            ax_board.add_patch(rect)
-
-    if highlight_coords:
-        col_index, row_index = highlight_coords
-        highlight = patches.Rectangle((col_index, row_index), 1, 1, facecolor='yellow', alpha=0.3)
-        ax_board.add_patch(highlight)
-
-    if pawn_pos:
-        col_index = COLS.index(pawn_pos[0])
-        row_index = ROWS.index(pawn_pos[1])
-        pawn = patches.Circle((col_index + 0.5, row_index + 0.5), 0.3, color='black')
-        ax_board.add_patch(pawn)
-
-    if pawn_target:
-        col_index = COLS.index(pawn_target[0])
-        row_index = ROWS.index(pawn_target[1])
-        pawn = patches.Circle((col_index + 0.5, row_index + 0.5), 0.3, color='black')
-        ax_board.add_patch(pawn)
-
-    ax_board.set_xlim(0, 8)
-    ax_board.set_ylim(0, 8)
-    ax_board.set_xticks(np.arange(8) + 0.5)
-    ax_board.set_yticks(np.arange(8) + 0.5)
-    ax_board.set_xticklabels(COLS)
-    ax_board.set_yticklabels(ROWS)
-    ax_board.set_title("Chessboard: Select by Volume")
-    ax_board.invert_yaxis()
-    ax_board.set_aspect('equal')
-    ax_board.grid(False)
+SQUARE = 60  # pixels per board square
+FPS = 60
+BOARD_X, BOARD_Y = 110, 50
+BOARD_SIZE = 8 * SQUARE
+WIDTH = BOARD_X + BOARD_SIZE + 30
+HEIGHT = BOARD_Y + BOARD_SIZE + 110
+COL_BAR_RECT = pygame.Rect(35, BOARD_Y, 30, BOARD_SIZE)  # vertical - for column
+ROW_BAR_RECT = pygame.Rect(BOARD_X, BOARD_Y + BOARD_SIZE + 65, BOARD_SIZE, 30)  # horizontal - for row
+SQUARE_COLORS = [pygame.Color('#F0D9B5'), pygame.Color('#B58863')]
+BAR_COLOR = pygame.Color('blue')
+
+pygame.init()
+screen = pygame.display.set_mode((WIDTH, HEIGHT))
+pygame.display.set_caption("Chessboard: Select by Volume")
+font = pygame.font.SysFont(None, 24)
+clock = pygame.time.Clock()
+
+def draw_text(surface, text, center):
+    label = font.render(text, True, pygame.Color('black'))
+    surface.blit(label, label.get_rect(center=center))
+
+# The board, labels and bar outlines never change, so render them once
+background = pygame.Surface((WIDTH, HEIGHT))
+background.fill(pygame.Color('white'))
+for row in range(8):
+    for col in range(8):
+        color = SQUARE_COLORS[(row + col) % 2]
+        background.fill(color, (BOARD_X + col * SQUARE, BOARD_Y + row * SQUARE, SQUARE, SQUARE))
+for i, (col_label, row_label) in enumerate(zip(COLS, ROWS)):
+    draw_text(background, col_label, (BOARD_X + (i + 0.5) * SQUARE, BOARD_Y + BOARD_SIZE + 15))
+    draw_text(background, row_label, (BOARD_X - 15, BOARD_Y + (i + 0.5) * SQUARE))
+draw_text(background, "Chessboard: Select by Volume", (BOARD_X + BOARD_SIZE / 2, BOARD_Y / 2))
+draw_text(background, "Column Volume", (COL_BAR_RECT.centerx + 15, BOARD_Y / 2))
+draw_text(background, "Row Volume", (ROW_BAR_RECT.centerx, ROW_BAR_RECT.top - 12))
+pygame.draw.rect(background, pygame.Color('black'), COL_BAR_RECT, 1)
+pygame.draw.rect(background, pygame.Color('black'), ROW_BAR_RECT, 1)
+
+highlight = pygame.Surface((SQUARE, SQUARE), pygame.SRCALPHA)
+highlight.fill((255, 255, 0, 77))  # yellow, alpha 0.3
+
+# Overlays drawn on top of the background each frame
+highlight_square = None
+pawn_squares = []
+row_volume = 0
+col_volume = 0
+
+def set_overlays(highlight_coords=None, pawn_pos=None, pawn_target=None):
+    global highlight_square, pawn_squares
+    highlight_square = highlight_coords
+    pawn_squares = [square for square in (pawn_pos, pawn_target) if square]
+
+def render():
+    screen.blit(background, (0, 0))
+
+    if highlight_square:
+        col_index, row_index = highlight_square
+        screen.blit(highlight, (BOARD_X + col_index * SQUARE, BOARD_Y + row_index * SQUARE))
+
+    for square in pawn_squares:
+        center = (BOARD_X + (COL_IX[square[0]] + 0.5) * SQUARE,
+                  BOARD_Y + (ROW_IX[square[1]] + 0.5) * SQUARE)
+        pygame.draw.circle(screen, pygame.Color('black'), center, 0.3 * SQUARE)
+
+    col_height = int(col_volume * COL_BAR_RECT.height)
+    screen.fill(BAR_COLOR, (COL_BAR_RECT.x, COL_BAR_RECT.bottom - col_height, COL_BAR_RECT.width, col_height))
+    screen.fill(BAR_COLOR, (ROW_BAR_RECT.x, ROW_BAR_RECT.y, int(row_volume * ROW_BAR_RECT.width), ROW_BAR_RECT.height))
+
+    pygame.display.flip()
 
 # --- Main Logic ---
-print("Start by selecting a ROW using your volume level...")
-draw_board()
-plt.ion()
-plt.show()
-
 row_index = None
 col_index = None
-
-with sd.InputStream(callback=callback):
-    while True:
-        try:
+resume_time = 0  # ticks are ignored until this time after a selection
+finished = False
+
+def finish():
+    global finished
+    finished = True
+
+def on_tick():
+    global state, selected_row, selected_col, hold_start_time, last_zone
+    global selection_timer_start, selection_stage, pawn_pos, pawn_target
+    global row_index, col_index, resume_time, row_volume, col_volume
+
+    # Drain to the newest sample so a backlog never makes the display lag
+    volume = None
+    try:
+        while True:
             volume = volume_queue.get_nowait()
-        except queue.Empty:
-            volume = 0
-
-        if state == "row":
-            row_bar.set_width(volume)
-            col_bar.set_height(0)
-        else:
-            col_bar.set_height(volume)
-            row_bar.set_width(0)
-
-        current_time = time.time()
-        if selection_timer_start is None:
-            selection_timer_start = current_time
-
-        # Timeout after max time
-        if current_time - selection_timer_start > MAX_SELECTION_TIME:
-            print("Selection timed out. Restarting...")
-            break
-
-        if state == "row":
-            row_index = int((1 - volume) * len(ROWS))
-            row_index = min(row_index, len(ROWS) - 1)
-            current_zone = ROWS[row_index]
-        else:
-            col_index = int(volume * len(COLS))
-            col_index = min(col_index, len(COLS) - 1)
-            current_zone = COLS[col_index]
-
-        if current_zone != last_zone:
-            hold_start_time = current_time
-            last_zone = current_zone
-        else:
-            if hold_start_time and (current_time - hold_start_time >= DURATION_TO_HOLD):
-                if state == "row":
-                    selected_row = current_zone
-                    print(f"Row selected: {selected_row}")
-                    state = "col"
+    except queue.Empty:
+        pass
+    if volume is None:
+        return
+
+    if state == "row":
+        row_volume = volume
+        col_volume = 0
+    else:
+        col_volume = volume
+        row_volume = 0
+
+    current_time = time.time()
+    if current_time < resume_time:
+        return
+    if selection_timer_start is None:
+        selection_timer_start = current_time
+
+    # Timeout after max time
+    if current_time - selection_timer_start > MAX_SELECTION_TIME:
+        print("Selection timed out. Restarting...")
+        finish()
+        return
+
+    if state == "row":
+        row_index = int((1 - volume) * len(ROWS))
+        row_index = min(row_index, len(ROWS) - 1)
+        current_zone = ROWS[row_index]
+    else:
+        col_index = int(volume * len(COLS))
+        col_index = min(col_index, len(COLS) - 1)
+        current_zone = COLS[col_index]
+
+    if current_zone != last_zone:
+        hold_start_time = current_time
+        last_zone = current_zone
+    else:
+        if hold_start_time and (current_time - hold_start_time >= DURATION_TO_HOLD):
+            if state == "row":
+                selected_row = current_zone
+                print(f"Row selected: {selected_row}")
+                state = "col"
+                hold_start_time = None
+                last_zone = None
+                selection_timer_start = None
+                print("Now select a COLUMN using volume...")
+                resume_time = current_time + 1
+            elif state == "col":
+                selected_col = current_zone
+                square = selected_col + selected_row
+                print(f"Final Square Selected: {square}")
+                if selection_stage == 0:
+                    pawn_pos = square
+                    selection_stage = 1
+                    state = "row"
                     hold_start_time = None
                     last_zone = None
                     selection_timer_start = None
-                    print("Now select a COLUMN using volume...")
-                    time.sleep(1)
-                elif state == "col":
-                    selected_col = current_zone
-                    square = selected_col + selected_row
-                    print(f"Final Square Selected: {square}")
-                    if selection_stage == 0:
-                        pawn_pos = square
-                        selection_stage = 1
-                        state = "row"
-                        hold_start_time = None
-                        last_zone = None
-                        selection_timer_start = None
-                        print("Now select destination ROW for the pawn...")
-                        time.sleep(1)
-                    else:
-                        pawn_target = square
-                        print("Pawn moved.")
-                        break
-
-        highlight_coords = (col_index if col_index is not None else 0,
-                            row_index if row_index is not None else 0)
-        draw_board(selected_square=None, highlight_coords=highlight_coords, pawn_pos=pawn_pos, pawn_target=None)
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        time.sleep(0.005)
-
-# Final board with pawn at target
-draw_board(pawn_pos=None, pawn_target=pawn_target)    
-plt.ioff()
-plt.show()
+                    print("Now select destination ROW for the pawn...")
+                    resume_time = current_time + 1
+                else:
+                    pawn_target = square
+                    print("Pawn moved.")
+                    finish()
+                    return
+
+    highlight_coords = (col_index if col_index is not None else 0,
+                        row_index if row_index is not None else 0)
+    set_overlays(highlight_coords=highlight_coords, pawn_pos=pawn_pos, pawn_target=None)
+
+print("Start by selecting a ROW using your volume level...")
+set_overlays()
+
+# Only listen to the microphone while a selection is in progress
+running = True
+with sd.InputStream(callback=callback):
+    while running and not finished:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        on_tick()
+        render()
+        clock.tick(FPS)
+
+# Final board with pawn at target, redrawn only when the window needs it
+set_overlays(pawn_pos=None, pawn_target=pawn_target)
+while running:
+    render()
+    if pygame.event.wait().type == pygame.QUIT:
+        running = False
+
+pygame.quit()
 print("Program finished.")
\ No newline at end of file
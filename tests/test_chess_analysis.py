@@ -0,0 +1,51 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from chess_analysis import _LineProtocol
+
+
+class TestLineProtocol:
+    @pytest.fixture
+    def lines(self) -> asyncio.Queue:
+        return asyncio.Queue()
+
+    @staticmethod
+    def drain(lines: asyncio.Queue) -> List[Optional[str]]:
+        result = []
+        while not lines.empty():
+            result.append(lines.get_nowait())
+        return result
+
+    def test_splits_lines_across_chunks(self, lines: asyncio.Queue):
+        protocol = _LineProtocol(lines)
+        protocol.data_received(b"uci")
+        protocol.data_received(b"ok\nreadyok\ninfo dep")
+        assert self.drain(lines) == ["uciok", "readyok"]
+        protocol.data_received(b"th 1\n")
+        assert self.drain(lines) == ["info depth 1"]
+
+    def test_multibyte_character_split_across_chunks(self, lines: asyncio.Queue):
+        protocol = _LineProtocol(lines)
+        data = "info string nn-é.nnue\n".encode()
+        split = data.index(b"\xc3") + 1
+        protocol.data_received(data[:split])
+        protocol.data_received(data[split:])
+        assert self.drain(lines) == ["info string nn-é.nnue"]
+
+    def test_invalid_bytes_are_replaced(self, lines: asyncio.Queue):
+        protocol = _LineProtocol(lines)
+        protocol.data_received(b"info string \xff\xfe\nreadyok\n")
+        assert self.drain(lines) == ["info string ��", "readyok"]
+
+    def test_eof_flushes_last_line_without_newline(self, lines: asyncio.Queue):
+        protocol = _LineProtocol(lines)
+        protocol.data_received(b"bestmove e2e4\nquit")
+        protocol.eof_received()
+        assert self.drain(lines) == ["bestmove e2e4", "quit", None]
+
+    def test_connection_lost_wakes_readers(self, lines: asyncio.Queue):
+        protocol = _LineProtocol(lines)
+        protocol.connection_lost(BrokenPipeError())
+        assert self.drain(lines) == [None]